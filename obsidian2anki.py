@@ -5,15 +5,16 @@ import argparse
 from pathlib import Path
 from src.converter import convert_directory, convert_markdown_to_html
 from src.anki_connect import check_anki_running, ensure_deck_exists, add_note
-from src.card_types import create_card_handler
+from src.card_types import create_card_handler, detect_card_type, available_card_types
 
 def main():
     """Main entry point."""
     print("[DEBUG] Starting obsidian2anki main()")
     parser = argparse.ArgumentParser(description='Convert Obsidian notes to Anki cards.')
     parser.add_argument('input', help='Input file or directory')
-    parser.add_argument('--type', choices=['qa', 'whole'], default='qa',
-                      help='Card type: qa (Question-Answer) or whole (Whole Note)')
+    parser.add_argument('--type', choices=['auto'] + available_card_types(), default='auto',
+                      help='Card type: auto (detect per file), qa (Question-Answer), whole (Whole Note) '
+                           'or a plugin type; a card_type key in frontmatter overrides it')
     parser.add_argument('--deck', default='Obsidian Notes',
                       help='Target deck name in Anki')
     
@@ -41,7 +42,9 @@ def main():
             print(f"[DEBUG] File content loaded, length: {len(content)}")
             
             # Extract cards using appropriate handler
-            handler = create_card_handler(args.type)
+            card_type = detect_card_type(content, args.type)
+            print(f"[DEBUG] Using card type: {card_type}")
+            handler = create_card_handler(card_type)
             cards = handler.extract_cards(content, input_path)
             
             # Add each card to Anki
@@ -3,24 +3,71 @@
 from abc import ABC, abstractmethod
 import frontmatter
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Callable, Type
+from importlib.metadata import entry_points
+from functools import lru_cache
 import re
 
+ENTRY_POINT_GROUP = 'obsidian2anki.card_handlers'
+FRONTMATTER_KEY = 'card_type'
+DEFAULT_CARD_TYPE = 'whole'
+
+_CODE_FENCE_RE = re.compile(r'^(`{3,}|~{3,}).*?^\1[^\n]*$', re.MULTILINE | re.DOTALL)
+
+# Registered handler classes and their per-process instances, keyed by type name
+_handler_classes: Dict[str, Type['CardHandler']] = {}
+_handler_instances: Dict[str, 'CardHandler'] = {}
+_detection_order: List[str] = []
+_entry_points_loaded = False
+
 class CardHandler(ABC):
     """Abstract base class for card handlers."""
     
+    # Handlers with a higher priority are asked first during auto detection
+    priority = 0
+    
+    def matches(self, content: str) -> bool:
+        """Return True if content looks like this handler's format.
+        
+        Receives the note body without frontmatter, with each line of fenced
+        code blocks replaced by a placeholder. Should be cheap: it runs for
+        every note in auto mode.
+        """
+        return False
+    
     @abstractmethod
     def extract_cards(self, content: str, file_path: Path) -> List[Tuple[str, str]]:
         """Extract cards from content."""
         pass
 
+def register_card_handler(name: str) -> Callable[[Type[CardHandler]], Type[CardHandler]]:
+    """Class decorator registering a card handler under a type name."""
+    def decorator(cls: Type[CardHandler]) -> Type[CardHandler]:
+        _handler_classes[name] = cls
+        _handler_instances.pop(name, None)
+        _detection_order.clear()
+        return cls
+    return decorator
+
+@register_card_handler('qa')
 class QACardHandler(CardHandler):
     """Handler for Question-Answer format cards."""
     
+    priority = -10
+    SECTION_RE = re.compile(r'\n##\s+')
+    
+    # A split point whose question line is followed by a non-blank line that is
+    # not itself a split point, i.e. a section extract_cards turns into a card
+    CARD_RE = re.compile(r'\n##\s+[^\n]*\S[^\n]*(?:\n[ \t]*)*\n(?!##\s)[ \t]*\S')
+    
+    def matches(self, content: str) -> bool:
+        """A note is treated as Q&A if it has a question heading with an answer."""
+        return self.CARD_RE.search(content) is not None
+    
     def extract_cards(self, content: str, file_path: Path) -> List[Tuple[str, str]]:
         """Extract question-answer pairs from content."""
         cards = []
-        sections = re.split(r'\n##\s+', content)
+        sections = self.SECTION_RE.split(content)
         
         for section in sections[1:]:  # Skip the first section (title)
             lines = section.strip().split('\n', 1)
@@ -30,13 +77,16 @@ class QACardHandler(CardHandler):
         
         return cards
 
+@register_card_handler('whole')
 class WholeNoteCardHandler(CardHandler):
     """Handler for whole note as single card format."""
     
+    priority = -20
+    
     def extract_cards(self, content: str, file_path: Path) -> List[Tuple[str, str]]:
         """Convert the whole note into a single card."""
         # Parse frontmatter and content
-        post = frontmatter.loads(content)
+        post = parse_frontmatter(content)
         body = post.content.strip()
         
         # Split content into title and body
@@ -60,14 +110,102 @@ class WholeNoteCardHandler(CardHandler):
         
         return [(title, body)]
 
+def load_entry_point_handlers() -> None:
+    """Register third-party handlers advertised through entry points, once per process."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    
+    _detection_order.clear()
+    
+    try:
+        group = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:
+        # Python < 3.10 returns a dict of groups and takes no arguments
+        group = entry_points().get(ENTRY_POINT_GROUP, [])
+    
+    for entry_point in group:
+        if entry_point.name in _handler_classes:
+            continue
+        try:
+            handler_class = entry_point.load()
+        except Exception as e:
+            print(f"Error loading card handler '{entry_point.name}': {e}")
+            continue
+        if not (isinstance(handler_class, type) and issubclass(handler_class, CardHandler)):
+            print(f"Error loading card handler '{entry_point.name}': "
+                  f"{handler_class!r} is not a CardHandler subclass")
+            continue
+        _handler_classes[entry_point.name] = handler_class
+
+def available_card_types() -> List[str]:
+    """Return the names of all registered card types."""
+    load_entry_point_handlers()
+    return list(_handler_classes.keys())
+
 def create_card_handler(card_type: str) -> CardHandler:
-    """Create a card handler based on type."""
-    handlers = {
-        'qa': QACardHandler(),
-        'whole': WholeNoteCardHandler()
-    }
+    """Return the shared handler instance for a card type."""
+    handler = _handler_instances.get(card_type)
+    if handler is not None:
+        return handler
+    
+    load_entry_point_handlers()
+    if card_type not in _handler_classes:
+        raise ValueError(f"Unknown card type: {card_type}. Available types: {list(_handler_classes.keys())}")
+    
+    handler = _handler_classes[card_type]()
+    _handler_instances[card_type] = handler
+    return handler
+
+@lru_cache(maxsize=1)
+def parse_frontmatter(content: str) -> frontmatter.Post:
+    """Parse a note's frontmatter, reusing the result for repeated calls on the same note."""
+    return frontmatter.loads(content)
+
+def _fence_placeholder(match: 're.Match') -> str:
+    """Replace every line of a fenced code block with placeholder text."""
+    return '\n'.join('code' for _ in match.group(0).split('\n'))
+
+def _handler_detection_order() -> List[str]:
+    """Return the registered card types, highest priority first."""
+    if not _detection_order:
+        _detection_order.extend(sorted(available_card_types(),
+                                       key=lambda name: create_card_handler(name).priority,
+                                       reverse=True))
+    return _detection_order
+
+def detect_card_type(content: str, card_type: str = 'auto') -> str:
+    """Pick the card type for a single note.
+    
+    A ``card_type`` key in the frontmatter always wins unless it is ``auto`` or
+    unknown. Otherwise an explicit ``card_type`` argument is used as is, and
+    ``'auto'`` asks the registered handlers, highest priority first, whether the
+    note body matches their format, falling back to whole-note cards.
+    """
+    try:
+        post = parse_frontmatter(content)
+    except Exception as e:
+        print(f"Error parsing frontmatter: {e}")
+        post = None
+    
+    declared = str(post.get(FRONTMATTER_KEY) or '').strip().lower() if post is not None else ''
+    if declared and declared != 'auto':
+        if declared in available_card_types():
+            return declared
+        print(f"Unknown card type in frontmatter: {declared}. "
+              f"Available types: {available_card_types()}")
+    if card_type != 'auto':
+        return card_type
     
-    if card_type not in handlers:
-        raise ValueError(f"Unknown card type: {card_type}. Available types: {list(handlers.keys())}")
+    body = content
+    if post is not None and content.lstrip().startswith('---'):
+        # Keep the line break that ended the frontmatter so a heading right
+        # after it still counts as a section, as it does during extraction
+        body = '\n' + post.content
+    body = _CODE_FENCE_RE.sub(_fence_placeholder, body)
     
-    return handlers[card_type] 
\ No newline at end of file
+    for name in _handler_detection_order():
+        if create_card_handler(name).matches(body):
+            return name
+    return DEFAULT_CARD_TYPE
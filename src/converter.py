@@ -5,7 +5,7 @@ import markdown
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 import re
-from .card_types import create_card_handler
+from .card_types import create_card_handler, detect_card_type
 from .anki_connect import ensure_deck_exists, add_note
 
 def extract_and_replace_math(content: str) -> Tuple[str, dict]:
@@ -45,8 +45,8 @@ def process_obsidian_file(file_path: Path, card_type: str) -> List[Tuple[str, st
     """Process a single Obsidian markdown file."""
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
-    # Extract cards using appropriate handler
-    handler = create_card_handler(card_type)
+    # Extract cards using the handler chosen for this file
+    handler = create_card_handler(detect_card_type(content, card_type))
     cards = handler.extract_cards(content, file_path)
     # Convert each card's content to HTML
     converted_cards = []
@@ -2,10 +2,12 @@
 
 import unittest
 from pathlib import Path
-from src.card_types import QACardHandler, WholeNoteCardHandler, create_card_handler
+from src import card_types
+from src.card_types import (QACardHandler, WholeNoteCardHandler, CardHandler, create_card_handler,
+                            detect_card_type, register_card_handler, available_card_types)
 import tempfile
 import shutil
-from src.converter import convert_directory
+from src.converter import convert_directory, process_obsidian_file
 
 class TestCardHandlers(unittest.TestCase):
     def setUp(self):
@@ -89,6 +91,86 @@ This is the body of the note.
         self.assertIsInstance(qa_handler, QACardHandler)
         self.assertIsInstance(whole_handler, WholeNoteCardHandler)
 
+    def test_create_card_handler_reuses_instances(self):
+        """Test that handlers are instantiated once per process."""
+        self.assertIs(create_card_handler('qa'), create_card_handler('qa'))
+        self.assertIs(create_card_handler('whole'), create_card_handler('whole'))
+
+    def test_register_card_handler(self):
+        """Test registering a custom handler type."""
+        self.addCleanup(card_types._handler_classes.pop, 'test-cloze', None)
+        self.addCleanup(card_types._handler_instances.pop, 'test-cloze', None)
+        self.addCleanup(card_types._detection_order.clear)
+
+        @register_card_handler('test-cloze')
+        class ClozeCardHandler(CardHandler):
+            def matches(self, content):
+                return '{{c1::' in content
+
+            def extract_cards(self, content, file_path):
+                return [(content, '')]
+
+        self.assertIn('test-cloze', available_card_types())
+        self.assertIsInstance(create_card_handler('test-cloze'), ClozeCardHandler)
+        self.assertEqual(detect_card_type("Paris is {{c1::the capital}}"), 'test-cloze')
+
+        # Custom handlers are asked before the built-in qa handler
+        self.assertEqual(detect_card_type("# Capitals\n## France\nParis is {{c1::the capital}}"),
+                         'test-cloze')
+
+    def test_detect_card_type(self):
+        """Test per-file card type detection."""
+        # Content sniffing
+        self.assertEqual(detect_card_type(self.qa_content), 'qa')
+        self.assertEqual(detect_card_type(self.whole_content), 'whole')
+        self.assertEqual(detect_card_type(""), 'whole')
+
+        # Explicit type is used when frontmatter does not declare one
+        self.assertEqual(detect_card_type(self.qa_content, 'whole'), 'whole')
+
+        # Frontmatter always wins
+        content = "---\ntags: [test]\ncard_type: whole\n---\n# Note\n## Section\nText"
+        self.assertEqual(detect_card_type(content), 'whole')
+        self.assertEqual(detect_card_type(content, 'qa'), 'whole')
+
+    def test_detect_card_type_frontmatter_values(self):
+        """Test frontmatter card types that are auto, unknown or differently cased."""
+        content = "---\ncard_type: auto\n---\n# Note\n## Question\nAnswer"
+        self.assertEqual(detect_card_type(content), 'qa')
+        self.assertEqual(detect_card_type(content, 'whole'), 'whole')
+
+        content = "---\ncard_type: QA\n---\n# Note\nBody"
+        self.assertEqual(detect_card_type(content), 'qa')
+
+        content = "---\ncard_type: qa # reviewed\n---\n# Note\nBody"
+        self.assertEqual(detect_card_type(content), 'qa')
+
+        content = "---\ncard_type: flashcard\n---\n# Note\nBody"
+        self.assertEqual(detect_card_type(content), 'whole')
+        self.assertEqual(detect_card_type(content, 'qa'), 'qa')
+
+    def test_detect_card_type_matches_extraction(self):
+        """Test that auto detection only picks qa when it yields cards."""
+        # A heading at the very start is not split off by the qa handler
+        self.assertEqual(detect_card_type("## Only heading\nanswer text"), 'whole')
+
+        # A heading right after the frontmatter is
+        content = "---\ntags: [test]\n---\n## Question\nAnswer"
+        self.assertEqual(detect_card_type(content), 'qa')
+        self.assertEqual(len(self.qa_handler.extract_cards(content, self.test_file_path)), 1)
+
+        # Comments inside fenced code are not headings
+        content = "# Shell Tips\nRun this:\n```bash\n## comment in code\necho\n```\nbody"
+        self.assertEqual(detect_card_type(content), 'whole')
+        content = "# Shell Tips\n~~~python\n## comment\n~~~\n## Question\nAnswer"
+        self.assertEqual(detect_card_type(content), 'qa')
+
+        # Answers made only of code blocks still count as answers
+        content = ("# Bash\n## How do I list files?\n```bash\nls -la\n```\n"
+                   "## How do I print?\n```bash\necho hi\n```\n")
+        self.assertEqual(detect_card_type(content), 'qa')
+        self.assertEqual(len(self.qa_handler.extract_cards(content, self.test_file_path)), 2)
+
     def test_empty_content(self):
         """Test handlers with empty content."""
         empty_content = ""
@@ -126,5 +208,17 @@ This is the body of the note.
             num_cards = convert_directory(tmpdir, "Test Deck", "whole")
             self.assertEqual(num_cards, len(file_contents))
 
+    def test_process_obsidian_file_auto_type(self):
+        """Test that auto mode picks the card type per file."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            tmpdir = Path(tmpdirname)
+            qa_file = tmpdir / "qa.md"
+            qa_file.write_text(self.qa_content, encoding="utf-8")
+            whole_file = tmpdir / "whole.md"
+            whole_file.write_text(self.whole_content, encoding="utf-8")
+
+            self.assertEqual(len(process_obsidian_file(qa_file, 'auto')), 2)
+            self.assertEqual(len(process_obsidian_file(whole_file, 'auto')), 1)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file